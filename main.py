@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 """
 YouTube Comment Analytics - Pop the Balloon
-Scrapes comments from the latest episode and exports to CSV
+Scrapes comments from the latest episode and exports to Parquet
 """
 
 import os
-import csv
+import time
+import asyncio
+import argparse
 import logging
-from typing import Optional, List, Dict
-from googleapiclient.discovery import build
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Optional, List, Dict, Tuple
+import orjson
+import pyarrow as pa
+import pyarrow.parquet
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # fetch_comments() is used as the sync fallback
+    aiohttp = None
 
 # Configure logging
 logging.basicConfig(
@@ -18,19 +32,195 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
-YOUTUBE_API_SERVICE_NAME = 'youtube'
-YOUTUBE_API_VERSION = 'v3'
 API_KEY_FILE = 'api_key.txt'
-OUTPUT_CSV = 'pop_the_balloon_comments.csv'
+OUTPUT_PARQUET = 'pop_the_balloon_comments.parquet'
+COMMENTS_SCHEMA = pa.schema([
+    ('author_name', pa.string()),
+    ('likes', pa.int64()),
+    ('reply_count', pa.int64()),
+    ('comment_text', pa.string())
+])
+YOUTUBE_API_URL = 'https://www.googleapis.com/youtube/v3'
+COMMENT_THREADS_URL = f'{YOUTUBE_API_URL}/commentThreads'
+PLAYLIST_ITEMS_URL = f'{YOUTUBE_API_URL}/playlistItems'
+SEARCH_URL = f'{YOUTUBE_API_URL}/search'
+# Only the paths parse_comment() and the pager read; the rest of each snippet is dropped server-side
+COMMENT_FIELDS = (
+    'nextPageToken,'
+    'items(id,snippet(totalReplyCount,'
+    'topLevelComment/snippet(authorDisplayName,likeCount,textDisplay)))'
+)
+HTTP_POOL_SIZE = 20
+COMMENTS_CACHE_FILE = 'comments_cache.json'
+COMMENTS_CACHE_VERSION = 2  # Pages store comment IDs into the comments list
+META_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'pop-the-balloon', 'meta.json')
+CHANNEL_CACHE_TTL = 30 * 86400  # Channel IDs never change
+LATEST_VIDEO_CACHE_TTL = 3600  # New episodes land at most daily
 CHANNEL_QUERY = 'Pop the Balloon'
 CHANNEL_OWNER = 'Arlette Amuli'
 
 
+class DiskCache:
+    """Small JSON file of timestamped values, each read back with its own TTL"""
+
+    def __init__(self, cache_file: str = META_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries = self.load()
+
+    def load(self) -> Dict:
+        """Load the cache file, starting empty if missing or unreadable"""
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                return orjson.loads(f.read())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable {self.cache_file}: {e}")
+            return {}
+
+    def write(self) -> None:
+        """Write all entries back to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'wb') as f:
+                f.write(orjson.dumps(self.entries))
+        except Exception as e:
+            logger.warning(f"Could not write {self.cache_file}: {e}")
+
+    def get(self, key: str, ttl: float):
+        """Return the cached value if it is younger than ttl seconds"""
+        entry = self.entries.get(key)
+        if entry is None or time.time() - entry['ts'] >= ttl:
+            return None
+        return entry['value']
+
+    def set(self, key: str, value) -> None:
+        """Store a value stamped with the current time"""
+        self.entries[key] = {'value': value, 'ts': time.time()}
+        self.write()
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self.entries = {}
+        self.write()
+
+
+class CommentPageCache:
+    """Sidecar cache of commentThreads pages keyed by (video_id, pageToken)
+
+    Each page keeps the ETag it was served with so unchanged pages can be
+    revalidated with a conditional GET. The flattened comments of the last
+    complete fetch are kept too, for the incremental short-circuit; pages
+    refer to them by ID rather than storing a second copy. Only the most
+    recently saved video is kept.
+    """
+
+    def __init__(self, cache_file: str = COMMENTS_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries = self.load()
+        self.touched_pages = {}
+        self.comment_index = {}  # video_id -> {comment_id: comment}, built on first use
+
+    def load(self) -> Dict:
+        """Load the cache file, starting empty if missing or unreadable"""
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                entries = orjson.loads(f.read())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable {self.cache_file}: {e}")
+            return {}
+        # Pages fetched with a different fields mask may lack or misread columns
+        return {
+            video_id: entry for video_id, entry in entries.items()
+            if entry.get('fields') == COMMENT_FIELDS
+            and entry.get('version') == COMMENTS_CACHE_VERSION
+        }
+
+    def clear(self) -> None:
+        """Drop every cached page and comment"""
+        self.entries = {}
+        self.touched_pages = {}
+        self.comment_index = {}
+        try:
+            os.remove(self.cache_file)
+        except FileNotFoundError:
+            pass
+
+    def get_page(self, video_id: str, page_token: Optional[str]) -> Optional[Dict]:
+        """Return a cached page, marking it as still in use"""
+        key = page_token or ''
+        entry = self.entries.get(video_id, {})
+        stored = entry.get('pages', {}).get(key)
+        if stored is None:
+            return None
+        by_id = self.comment_index.get(video_id)
+        if by_id is None:
+            by_id = {c['comment_id']: c for c in entry.get('comments', [])}
+            self.comment_index[video_id] = by_id
+        page = {
+            'etag': stored['etag'],
+            'items': [by_id[i] for i in stored['comment_ids'] if i in by_id],
+            'next_page_token': stored['next_page_token']
+        }
+        self.touched_pages.setdefault(video_id, {})[key] = page
+        return page
+
+    def get_etag(self, video_id: str, page_token: Optional[str]) -> Optional[str]:
+        """Return the ETag a page was last served with"""
+        page = self.entries.get(video_id, {}).get('pages', {}).get(page_token or '')
+        return page['etag'] if page else None
+
+    def store_page(self, video_id: str, page_token: Optional[str], etag: Optional[str],
+                   items: List[Dict], next_page_token: Optional[str]) -> Dict:
+        """Record a freshly downloaded page"""
+        page = {'etag': etag, 'items': items, 'next_page_token': next_page_token}
+        self.touched_pages.setdefault(video_id, {})[page_token or ''] = page
+        return page
+
+    def get_comments(self, video_id: str) -> List[Dict]:
+        """Return the comments from the last complete fetch, newest first"""
+        return self.entries.get(video_id, {}).get('comments', [])
+
+    def save(self, video_id: str, comments: List[Dict]) -> None:
+        """Persist this run's pages and comments, dropping pages no longer served
+
+        Any other video's entry is dropped too, so the file holds one episode.
+        """
+        pages = {
+            key: {
+                'etag': page['etag'],
+                'comment_ids': [item['comment_id'] for item in page['items']],
+                'next_page_token': page['next_page_token']
+            }
+            for key, page in self.touched_pages.pop(video_id, {}).items()
+        }
+        self.entries = {video_id: {
+            'fields': COMMENT_FIELDS,
+            'version': COMMENTS_CACHE_VERSION,
+            'pages': pages,
+            'comments': comments
+        }}
+        self.comment_index = {}
+        try:
+            with open(self.cache_file, 'wb') as f:
+                f.write(orjson.dumps(self.entries))
+        except Exception as e:
+            logger.warning(f"Could not write {self.cache_file}: {e}")
+
+
 class YouTubeCommentScraper:
-    def __init__(self):
-        self.youtube = None
+    def __init__(self, refresh: bool = False, full: bool = False):
+        self.full = full
         self.api_key = self.load_api_key()
-        self.authenticate()
+        self.session = self.create_session()
+        self.comment_cache = CommentPageCache()
+        self.meta_cache = DiskCache()
+        if refresh:
+            logger.info("Refreshing cached channel, video and comment lookups")
+            self.meta_cache.clear()
+            self.comment_cache.clear()
 
     def load_api_key(self) -> str:
         """Load API key from file"""
@@ -45,27 +235,44 @@ class YouTubeCommentScraper:
             raise ValueError("API key file is empty")
         return key
 
-    def authenticate(self) -> None:
-        """Authenticate with YouTube API using API key"""
-        logger.info("Authenticating with YouTube API key...")
-        self.youtube = build(
-            YOUTUBE_API_SERVICE_NAME,
-            YOUTUBE_API_VERSION,
-            developerKey=self.api_key
-        )
-        logger.info("Authentication successful")
+    @staticmethod
+    def create_session() -> requests.Session:
+        """Create a keep-alive HTTP session with pooled connections and retries"""
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504)
+            )
+        ))
+        return session
+
+    def api_get(self, url: str, **params) -> Dict:
+        """GET a YouTube Data API endpoint and decode the JSON body"""
+        resp = self.session.get(url, params={**params, 'key': self.api_key})
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
     def find_channel(self, channel_name: str) -> Optional[str]:
         """Search for a channel and return its ID"""
+        cache_key = f"channel_id:{channel_name}"
+        channel_id = self.meta_cache.get(cache_key, CHANNEL_CACHE_TTL)
+        if channel_id:
+            logger.info(f"Using cached channel ID for {channel_name}: {channel_id}")
+            return channel_id
+
         logger.info(f"Searching for channel: {channel_name}")
         try:
-            request = self.youtube.search().list(
+            response = self.api_get(
+                SEARCH_URL,
                 q=channel_name,
                 type='channel',
                 part='snippet',
                 maxResults=5
             )
-            response = request.execute()
 
             if not response.get('items'):
                 logger.error(f"No channels found matching '{channel_name}'")
@@ -81,6 +288,7 @@ class YouTubeCommentScraper:
             # Return first result (user can verify it's correct)
             channel_id = response['items'][0]['id']['channelId']
             logger.info(f"Using channel: {response['items'][0]['snippet']['title']}")
+            self.meta_cache.set(cache_key, channel_id)
             return channel_id
 
         except Exception as e:
@@ -89,94 +297,296 @@ class YouTubeCommentScraper:
 
     def get_latest_video(self, channel_id: str) -> Optional[str]:
         """Get the latest video ID from a channel"""
+        cache_key = f"latest_video:{channel_id}"
+        video_id = self.meta_cache.get(cache_key, LATEST_VIDEO_CACHE_TTL)
+        if video_id:
+            logger.info(f"Using cached latest video: {video_id}")
+            return video_id
+
         logger.info(f"Fetching latest video from channel {channel_id}")
         try:
-            request = self.youtube.search().list(
-                channelId=channel_id,
-                type='video',
-                part='snippet',
-                maxResults=1,
-                order='date'
-            )
-            response = request.execute()
+            response = self.api_get(PLAYLIST_ITEMS_URL, **self.latest_video_params(channel_id))
+            return self.resolve_latest_video(channel_id, response)
 
-            if not response.get('items'):
-                logger.error("No videos found in channel")
-                return None
+        except Exception as e:
+            logger.error(f"Error fetching latest video: {e}")
+            return None
 
-            video_id = response['items'][0]['id']['videoId']
-            video_title = response['items'][0]['snippet']['title']
-            logger.info(f"Latest video: {video_title} (ID: {video_id})")
-            return video_id
+    async def get_latest_video_async(self, session, channel_id: str) -> Optional[str]:
+        """Get the latest video ID from a channel, bypassing the cache"""
+        logger.info(f"Fetching latest video from channel {channel_id}")
+        try:
+            params = {**self.latest_video_params(channel_id), 'key': self.api_key}
+            async with session.get(PLAYLIST_ITEMS_URL, params=params) as resp:
+                resp.raise_for_status()
+                response = orjson.loads(await resp.read())
+            return self.resolve_latest_video(channel_id, response)
 
         except Exception as e:
             logger.error(f"Error fetching latest video: {e}")
             return None
 
+    @staticmethod
+    def latest_video_params(channel_id: str) -> Dict:
+        """Query the channel's uploads playlist for its newest entry
+
+        The uploads playlist lists newest first and costs 1 quota unit,
+        versus 100 for search.list(order='date').
+        """
+        return {
+            'playlistId': 'UU' + channel_id[2:],
+            'part': 'snippet',
+            'maxResults': 1
+        }
+
+    def resolve_latest_video(self, channel_id: str, response: Dict) -> Optional[str]:
+        """Pick the video ID out of a playlistItems response and cache it"""
+        if not response.get('items'):
+            logger.error("No videos found in channel")
+            return None
+
+        video_id = response['items'][0]['snippet']['resourceId']['videoId']
+        video_title = response['items'][0]['snippet']['title']
+        logger.info(f"Latest video: {video_title} (ID: {video_id})")
+        self.meta_cache.set(f"latest_video:{channel_id}", video_id)
+        return video_id
+
+    @staticmethod
+    def parse_comment(item: Dict) -> Dict:
+        """Flatten a commentThread resource into a comment record"""
+        snippet = item['snippet']['topLevelComment']['snippet']
+        return {
+            'comment_id': item.get('id', ''),
+            'author_name': snippet.get('authorDisplayName', ''),
+            'likes': snippet.get('likeCount', 0),
+            'reply_count': item['snippet'].get('totalReplyCount', 0),
+            'comment_text': snippet.get('textDisplay', '')
+        }
+
+    def comment_page_request(self, video_id: str,
+                             page_token: Optional[str]) -> Tuple[Dict, Dict]:
+        """Build query params and conditional headers for a commentThreads page"""
+        params = {
+            'videoId': video_id,
+            'part': 'snippet',
+            'order': 'time',  # Newest first, for the incremental short-circuit
+            'maxResults': 100,  # Maximum allowed per request
+            'textFormat': 'plainText',
+            'fields': COMMENT_FIELDS,
+            'key': self.api_key
+        }
+        if page_token:
+            params['pageToken'] = page_token
+        headers = {}
+        etag = self.comment_cache.get_etag(video_id, page_token)
+        if etag:
+            headers['If-None-Match'] = etag
+        return params, headers
+
+    def resolve_comment_page(self, video_id: str, page_token: Optional[str],
+                             status: int, etag: Optional[str], body: bytes) -> Dict:
+        """Turn a page response into items, reusing the cache on 304 Not Modified"""
+        if status == 304:
+            return self.comment_cache.get_page(video_id, page_token)
+        response = orjson.loads(body)
+        items = [self.parse_comment(item) for item in response.get('items', [])]
+        return self.comment_cache.store_page(
+            video_id, page_token, etag, items, response.get('nextPageToken')
+        )
+
+    def previous_comments(self, video_id: str) -> List[Dict]:
+        """Return cached comments to stop at, or none for a full fetch"""
+        if self.full:
+            return []
+        return self.comment_cache.get_comments(video_id)
+
+    @staticmethod
+    def reaches_seen(items: List[Dict], seen_comment_id: Optional[str]) -> bool:
+        """Whether a page contains the previously seen comment, ending the fetch"""
+        return seen_comment_id is not None and any(
+            item['comment_id'] == seen_comment_id for item in items
+        )
+
+    @staticmethod
+    def extend_until_seen(comments: List[Dict], items: List[Dict],
+                          seen_comment_id: Optional[str]) -> bool:
+        """Append new items, returning True once a previously seen comment is reached"""
+        for item in items:
+            if item['comment_id'] == seen_comment_id:
+                return True
+            comments.append(item)
+        return False
+
+    def fetch_comment_page(self, video_id: str, page_token: Optional[str]) -> Dict:
+        """Fetch and decode a single commentThreads page"""
+        params, headers = self.comment_page_request(video_id, page_token)
+        resp = self.session.get(COMMENT_THREADS_URL, params=params, headers=headers)
+        resp.raise_for_status()
+        return self.resolve_comment_page(
+            video_id, page_token, resp.status_code, resp.headers.get('ETag'), resp.content
+        )
+
     def fetch_comments(self, video_id: str) -> List[Dict]:
-        """Fetch all comments from a video with pagination"""
+        """Fetch all comments from a video with pagination (sync fallback)
+
+        A single background thread prefetches page N+1 while page N is
+        being merged, hiding most of each round-trip.
+        """
         logger.info(f"Fetching comments from video {video_id}")
         comments = []
-        page_token = None
         page_count = 0
-        total_comments = 0
+        previous = self.previous_comments(video_id)
+        seen_comment_id = previous[0]['comment_id'] if previous else None
+        executor = ThreadPoolExecutor(max_workers=1)
 
         try:
-            while True:
+            future_next = executor.submit(self.fetch_comment_page, video_id, None)
+            while future_next:
                 page_count += 1
                 logger.info(f"Fetching page {page_count}...")
+                page = future_next.result()
+
+                # Prefetch the next page before consuming this one, unless
+                # this page already reaches the previously fetched comments
+                page_token = page['next_page_token']
+                future_next = None
+                if page_token and not self.reaches_seen(page['items'], seen_comment_id):
+                    future_next = executor.submit(self.fetch_comment_page, video_id, page_token)
+
+                if self.extend_until_seen(comments, page['items'], seen_comment_id):
+                    logger.info(f"Reached previously fetched comments; "
+                                f"reusing {len(previous)} cached comments")
+                    comments.extend(previous)
+                    break
+
+            logger.info(f"Total comments fetched: {len(comments)} across {page_count} pages")
+            self.comment_cache.save(video_id, comments)
+            return comments
+
+        except Exception as e:
+            logger.error(f"Error fetching comments: {e}")
+            return comments
 
-                request = self.youtube.commentThreads().list(
-                    videoId=video_id,
-                    part='snippet',
-                    maxResults=100,  # Maximum allowed per request
-                    pageToken=page_token,
-                    textFormat='plainText'
+        finally:
+            # Don't wait on a prefetch that is no longer needed
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def fetch_comment_page_async(self, session, video_id: str,
+                                       page_token: Optional[str]) -> Dict:
+        """Fetch and decode a single commentThreads page over aiohttp"""
+        params, headers = self.comment_page_request(video_id, page_token)
+        async with session.get(COMMENT_THREADS_URL, params=params, headers=headers) as resp:
+            resp.raise_for_status()
+            return self.resolve_comment_page(
+                video_id, page_token, resp.status, resp.headers.get('ETag'), await resp.read()
+            )
+
+    async def fetch_comments_async(self, video_id: str, session=None,
+                                   first_page: Optional[Dict] = None) -> List[Dict]:
+        """Fetch all comments from a video, pipelining page requests
+
+        Page tokens are serially dependent, so only one request can be in
+        flight. As soon as a page is decoded its successor is requested, and
+        the current page's items are merged while that round-trip is on the
+        wire. The session keeps a single connection alive throughout.
+        If first_page was already fetched, pagination starts from it.
+        """
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self.fetch_comments_async(video_id, session, first_page)
+
+        logger.info(f"Fetching comments from video {video_id}")
+        comments = []
+        page_count = 0
+        next_page = None
+        previous = self.previous_comments(video_id)
+        seen_comment_id = previous[0]['comment_id'] if previous else None
+
+        try:
+            if first_page is not None:
+                next_page = asyncio.get_running_loop().create_future()
+                next_page.set_result(first_page)
+            else:
+                next_page = asyncio.ensure_future(
+                    self.fetch_comment_page_async(session, video_id, None)
                 )
-                response = request.execute()
-
-                for item in response.get('items', []):
-                    snippet = item['snippet']['topLevelComment']['snippet']
-                    comment = {
-                        'author_name': snippet.get('authorDisplayName', ''),
-                        'likes': snippet.get('likeCount', 0),
-                        'reply_count': item['snippet'].get('replyCount', 0),
-                        'comment_text': snippet.get('textDisplay', '')
-                    }
-                    comments.append(comment)
-                    total_comments += 1
-
-                # Check if there are more pages
-                page_token = response.get('nextPageToken')
-                if not page_token:
+            while next_page:
+                page_count += 1
+                logger.info(f"Fetching page {page_count}...")
+                page = await next_page
+
+                # Launch the successor before consuming this page, unless
+                # this page already reaches the previously fetched comments
+                page_token = page['next_page_token']
+                next_page = None
+                if page_token and not self.reaches_seen(page['items'], seen_comment_id):
+                    next_page = asyncio.ensure_future(
+                        self.fetch_comment_page_async(session, video_id, page_token)
+                    )
+                    await asyncio.sleep(0)  # Let the request get sent
+
+                if self.extend_until_seen(comments, page['items'], seen_comment_id):
+                    logger.info(f"Reached previously fetched comments; "
+                                f"reusing {len(previous)} cached comments")
+                    comments.extend(previous)
                     break
 
-            logger.info(f"Total comments fetched: {total_comments} across {page_count} pages")
+            logger.info(f"Total comments fetched: {len(comments)} across {page_count} pages")
+            self.comment_cache.save(video_id, comments)
             return comments
 
         except Exception as e:
             logger.error(f"Error fetching comments: {e}")
+            if next_page:
+                next_page.cancel()
             return comments
 
-    def export_to_csv(self, comments: List[Dict], output_file: str = OUTPUT_CSV) -> None:
-        """Export comments to CSV file"""
+    async def fetch_latest_comments_async(self, channel_id: str) -> Tuple[Optional[str], List[Dict]]:
+        """Resolve the channel's latest video and fetch its comments
+
+        When the cached latest video has expired it is usually still the
+        latest, so its first comment page is requested alongside the
+        playlist lookup and reused if the guess holds.
+        """
+        cache_key = f"latest_video:{channel_id}"
+        async with aiohttp.ClientSession() as session:
+            first_page = None
+            if self.meta_cache.get(cache_key, LATEST_VIDEO_CACHE_TTL):
+                video_id = self.get_latest_video(channel_id)  # Served from cache
+            else:
+                guess = self.meta_cache.get(cache_key, float('inf'))
+                if guess:
+                    logger.info(f"Speculatively fetching comments from previous latest video {guess}")
+                    video_id, first_page = await asyncio.gather(
+                        self.get_latest_video_async(session, channel_id),
+                        self.fetch_comment_page_async(session, guess, None),
+                        return_exceptions=True
+                    )
+                    if video_id != guess or isinstance(first_page, Exception):
+                        first_page = None
+                else:
+                    video_id = await self.get_latest_video_async(session, channel_id)
+
+            if not video_id:
+                return None, []
+            if first_page is not None:
+                logger.info("Latest video unchanged; reusing speculative first page")
+            return video_id, await self.fetch_comments_async(video_id, session, first_page)
+
+    def export_to_parquet(self, comments: List[Dict], output_file: str = OUTPUT_PARQUET) -> None:
+        """Export comments to a zstd-compressed Parquet file"""
         if not comments:
             logger.warning("No comments to export")
             return
 
         logger.info(f"Exporting {len(comments)} comments to {output_file}")
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['author_name', 'likes', 'reply_count', 'comment_text']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                writer.writerows(comments)
-
-            logger.info(f"CSV export successful: {output_file}")
+            table = pa.Table.from_pylist(comments, schema=COMMENTS_SCHEMA)
+            pyarrow.parquet.write_table(table, output_file, compression='zstd')
+            logger.info(f"Parquet export successful: {output_file}")
 
         except Exception as e:
-            logger.error(f"Error writing CSV file: {e}")
+            logger.error(f"Error writing Parquet file: {e}")
             raise
 
     def print_summary(self, comments: List[Dict]) -> None:
@@ -188,10 +598,9 @@ class YouTubeCommentScraper:
         total_likes = sum(c['likes'] for c in comments)
         total_replies = sum(c['reply_count'] for c in comments)
         avg_likes = total_likes / len(comments) if comments else 0
-        max_likes = max(c['likes'] for c in comments) if comments else 0
-        max_likes_comment = next(
-            (c for c in comments if c['likes'] == max_likes), None
-        )
+        # max() keeps the first of equal keys, so ties resolve as before
+        max_likes_comment = max(comments, key=itemgetter('likes'))
+        max_likes = max_likes_comment['likes']
 
         logger.info("\n" + "="*60)
         logger.info("SUMMARY STATISTICS")
@@ -201,10 +610,9 @@ class YouTubeCommentScraper:
         logger.info(f"Total Replies: {total_replies}")
         logger.info(f"Average Likes per Comment: {avg_likes:.2f}")
         logger.info(f"Most Liked Comment: {max_likes} likes")
-        if max_likes_comment:
-            text_preview = max_likes_comment['comment_text'][:60] + "..."
-            logger.info(f"  By: {max_likes_comment['author_name']}")
-            logger.info(f"  Text: {text_preview}")
+        text_preview = max_likes_comment['comment_text'][:60] + "..."
+        logger.info(f"  By: {max_likes_comment['author_name']}")
+        logger.info(f"  Text: {text_preview}")
         logger.info("="*60 + "\n")
 
     def run(self) -> None:
@@ -217,20 +625,21 @@ class YouTubeCommentScraper:
             logger.error("Failed to find channel")
             return
 
-        # Step 2: Get latest video
-        video_id = self.get_latest_video(channel_id)
+        # Steps 2 and 3: Get latest video and fetch its comments
+        if aiohttp is not None:
+            video_id, comments = asyncio.run(self.fetch_latest_comments_async(channel_id))
+        else:
+            video_id = self.get_latest_video(channel_id)
+            comments = self.fetch_comments(video_id) if video_id else []
         if not video_id:
             logger.error("Failed to get latest video")
             return
-
-        # Step 3: Fetch comments
-        comments = self.fetch_comments(video_id)
         if not comments:
             logger.warning("No comments retrieved")
             return
 
-        # Step 4: Export to CSV
-        self.export_to_csv(comments)
+        # Step 4: Export to Parquet
+        self.export_to_parquet(comments)
 
         # Step 5: Print summary
         self.print_summary(comments)
@@ -239,8 +648,21 @@ class YouTubeCommentScraper:
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='drop cached channel, latest-video and comment page lookups'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='re-read every comment page instead of stopping at previously fetched comments'
+    )
+    args = parser.parse_args()
+
     try:
-        scraper = YouTubeCommentScraper()
+        scraper = YouTubeCommentScraper(refresh=args.refresh, full=args.full)
         scraper.run()
     except KeyboardInterrupt:
         logger.info("Script interrupted by user")
@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 """
 YouTube Comment Sentiment Analysis - Pop the Balloon
-Analyzes comments using VADER sentiment analyzer
+Analyzes comments using VADER (default) or a quantized DistilBERT model
 """
 
-import csv
+import os
+import string
+import argparse
 import logging
-from typing import List, Dict
+from multiprocessing import Pool
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import BinaryIO, Iterator, List, Optional, Protocol, Tuple
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute
+import pyarrow.csv
+import pyarrow.parquet
 from nltk.sentiment import SentimentIntensityAnalyzer
+from nltk.sentiment.vader import SentiText, VaderConstants
 import nltk
 
 # Download VADER lexicon if not already present
@@ -24,118 +36,465 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
-INPUT_CSV = 'pop_the_balloon_comments.csv'
+INPUT_PARQUET = 'pop_the_balloon_comments.parquet'
+INPUT_CSV = 'pop_the_balloon_comments.csv'  # Older scraper output
 OUTPUT_CSV = 'pop_the_balloon_sentiment_analysis.csv'
+# Rows are appended to output + '.{scorer}' + this, renamed onto the output once complete
+PARTIAL_SUFFIX = '.partial'
 POSITIVE_THRESHOLD = 0.05
 NEGATIVE_THRESHOLD = -0.05
+# Label index = searchsorted(SENTIMENT_BINS, compound, side='right'). The upper
+# edge is nudged up one ulp so a compound of exactly POSITIVE_THRESHOLD stays
+# Neutral, matching the strict > / < comparisons.
+SENTIMENT_LABELS = np.array(['Negative', 'Neutral', 'Positive'])
+SENTIMENT_BINS = np.array([NEGATIVE_THRESHOLD, np.nextafter(POSITIVE_THRESHOLD, np.inf)])
+SENTIMENT_INDEX = {label: i for i, label in enumerate(SENTIMENT_LABELS)}
+OUTPUT_SCHEMA = pa.schema([
+    ('author_name', pa.string()),
+    ('sentiment', pa.string()),
+    ('compound_score', pa.float64()),
+    ('positive_score', pa.float64()),
+    ('negative_score', pa.float64()),
+    ('neutral_score', pa.float64()),
+    ('likes', pa.int64()),
+    ('reply_count', pa.int64()),
+    ('comment_text', pa.string())
+])
+INPUT_TYPES = {
+    'author_name': pa.string(),
+    'likes': pa.int64(),
+    'reply_count': pa.int64(),
+    'comment_text': pa.string()
+}
+# Score array column order: neg, neu, pos, compound
+SCORE_KEYS = itemgetter('neg', 'neu', 'pos', 'compound')
+# Bytes of CSV parsed per streaming step (one record batch)
+READ_BLOCK_SIZE = 1 << 20
+# Parquet rows read per streaming step
+READ_BATCH_ROWS = 8192
+# Flush and fsync the output once this many rows have been written since the last sync
+FLUSH_EVERY_ROWS = 1000
+# Below this many comments, worker start-up costs more than it saves
+PARALLEL_MIN_COMMENTS = 2000
+# polarity_scores is microsecond-scale, so batch many texts per IPC round-trip
+POOL_CHUNKSIZE = 256
+# Distinct comment texts remembered per analyzer ("First!", emoji-only spam...)
+SCORE_CACHE_SIZE = 8192
+# Optional transformer scorer (--model=onnx)
+ONNX_MODEL_PATH = 'distilbert-sst2-int8.onnx'
+ONNX_TOKENIZER = 'distilbert-base-uncased-finetuned-sst-2-english'
+ONNX_MAX_LENGTH = 128
+ONNX_BATCH_SIZE = 64
 
+# What VADER itself returns for text with no tokens
+EMPTY_SCORES = {'neg': 0.0, 'neu': 0.0, 'pos': 0.0, 'compound': 0.0}
+# What VADER returns when no token is in its lexicon: every valence is zero
+NEUTRAL_SCORES = {'neg': 0.0, 'neu': 1.0, 'pos': 0.0, 'compound': 0.0}
+_PUNC_CHARS = string.punctuation
+_PUNC_AFFIXES = frozenset(VaderConstants.PUNC_LIST)
+_PUNCT_RE = VaderConstants.REGEX_REMOVE_PUNCTUATION  # Compiled once at import
+
+
+class FastSentiText(SentiText):
+    """SentiText with the same tokens, without the punctuation cross product
+
+    SentiText strips a leading or trailing PUNC_LIST affix from a token
+    when what remains is a word of the punctuation-free text. To do that it
+    builds a dict of every affix/word combination for every comment. A
+    token can only match one way: its whole leading (or trailing)
+    punctuation run is the affix. So it is enough to split that run off
+    and check both halves.
+    """
+
+    def _words_and_emoticons(self):
+        wes = [we for we in self.text.split() if len(we) > 1]
+        words_only = None
+        for i, we in enumerate(wes):
+            if we[0] not in _PUNC_CHARS and we[-1] not in _PUNC_CHARS:
+                continue
+            if words_only is None:
+                words_only = {
+                    w for w in _PUNCT_RE.sub('', self.text).split() if len(w) > 1
+                }
+            word = we.lstrip(_PUNC_CHARS)
+            if len(word) < len(we):
+                affix = we[:len(we) - len(word)]
+            else:
+                word = we.rstrip(_PUNC_CHARS)
+                affix = we[len(word):]
+            if affix in _PUNC_AFFIXES and word in words_only:
+                wes[i] = word
+        return wes
+
+
+class FastSIA(SentimentIntensityAnalyzer):
+    """SentimentIntensityAnalyzer specialized for short YouTube comments
+
+    Scores are identical to the parent's: blank text returns VADER's empty
+    result without tokenizing, tokens come from FastSentiText, and text
+    with no lexicon word skips the valence pass.
+    """
+
+    def polarity_scores(self, text):
+        if not text or text.isspace():
+            return dict(EMPTY_SCORES)
+
+        # Same as SentimentIntensityAnalyzer.polarity_scores, bar the tokenizer
+        sentitext = FastSentiText(
+            text, self.constants.PUNC_LIST, self.constants.REGEX_REMOVE_PUNCTUATION
+        )
+        sentiments = []
+        words_and_emoticons = sentitext.words_and_emoticons
+        if not words_and_emoticons:
+            return dict(EMPTY_SCORES)
+        # No lexicon word means every valence is zero; the set check runs in C
+        if self.lexicon.keys().isdisjoint([we.lower() for we in words_and_emoticons]):
+            return dict(NEUTRAL_SCORES)
+
+        for item in words_and_emoticons:
+            valence = 0
+            i = words_and_emoticons.index(item)
+            if (
+                i < len(words_and_emoticons) - 1
+                and item.lower() == "kind"
+                and words_and_emoticons[i + 1].lower() == "of"
+            ) or item.lower() in self.constants.BOOSTER_DICT:
+                sentiments.append(valence)
+                continue
+
+            sentiments = self.sentiment_valence(valence, sentitext, item, i, sentiments)
+
+        sentiments = self._but_check(words_and_emoticons, sentiments)
+
+        return self.score_valence(sentiments, text)
+
+
+def make_cached_scorer(sia: SentimentIntensityAnalyzer):
+    """Memoize VADER score tuples by whitespace-normalized text
+
+    VADER tokenizes on whitespace, so collapsing runs of it never changes
+    a score. Case is kept: VADER boosts ALL CAPS words.
+    """
+    cached = lru_cache(maxsize=SCORE_CACHE_SIZE)(
+        lambda key: SCORE_KEYS(sia.polarity_scores(key))
+    )
+
+    def score(text: str) -> tuple:
+        return cached(' '.join(text.split()))
+
+    score.cache_info = cached.cache_info
+    return score
+
+
+# Per-worker cached scorer, built once by the pool initializer
+_SCORE = None
+# Cache hits and misses this worker has already reported to the parent
+_REPORTED = (0, 0)
+
+
+def _init_worker() -> None:
+    global _SCORE
+    _SCORE = make_cached_scorer(FastSIA())
+
+
+def _score_chunk(texts: List[str]) -> tuple:
+    """Score a chunk, returning the scores and the cache hits/misses it added"""
+    global _REPORTED
+    scores = [_SCORE(text) for text in texts]
+    info = _SCORE.cache_info()
+    delta = (info.hits - _REPORTED[0], info.misses - _REPORTED[1])
+    _REPORTED = (info.hits, info.misses)
+    return scores, delta
+
+
+class Scorer(Protocol):
+    # Key in SCORERS; partial output is only resumed by the scorer that wrote it
+    name: str
+
+    def score(self, texts: List[str]) -> np.ndarray:
+        """Return an (N, 4) array of neg, neu, pos, compound scores"""
+        ...
+
+    def close(self, abort: bool = False) -> None:
+        """Release any resources held across score() calls
+
+        abort is set when the run failed or was interrupted, so nothing
+        should wait on work still in progress.
+        """
+        ...
+
+
+class VaderScorer:
+    """Lexicon-based VADER scores, spread across cores for large inputs"""
+
+    name = 'vader'
 
-class SentimentAnalyzer:
     def __init__(self):
-        self.sia = SentimentIntensityAnalyzer()
-        self.comments = []
-        self.analyzed_comments = []
+        self.sia = FastSIA()
+        self._score = make_cached_scorer(self.sia)
+        self.pool = None
+        # Cache hits and misses summed over the pool workers
+        self.pool_hits = 0
+        self.pool_misses = 0
+
+    def score(self, texts: List[str]) -> np.ndarray:
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(texts) >= PARALLEL_MIN_COMMENTS:
+            if self.pool is None:
+                logger.info(f"Scoring across {workers} worker processes")
+                self.pool = Pool(workers, initializer=_init_worker)
+            chunks = [texts[i:i + POOL_CHUNKSIZE] for i in range(0, len(texts), POOL_CHUNKSIZE)]
+            raw_scores = []
+            for scores, (hits, misses) in self.pool.map(_score_chunk, chunks, chunksize=1):
+                raw_scores.extend(scores)
+                self.pool_hits += hits
+                self.pool_misses += misses
+        else:
+            raw_scores = [self._score(text) for text in texts]
+        return np.asarray(raw_scores, dtype=np.float64).reshape(-1, 4)
+
+    def close(self, abort: bool = False) -> None:
+        info = self._score.cache_info()
+        if info.hits or info.misses:
+            logger.info(f"VADER score cache: {info.hits} hits, {info.misses} misses "
+                        f"({info.currsize}/{info.maxsize} entries)")
+        if self.pool_hits or self.pool_misses:
+            logger.info(f"VADER score cache across workers: {self.pool_hits} hits, "
+                        f"{self.pool_misses} misses ({info.maxsize} entries per worker)")
+        if self.pool is not None:
+            if abort:
+                # Workers killed by Ctrl-C never finish their tasks, so join() would hang
+                self.pool.terminate()
+            else:
+                self.pool.close()
+            self.pool.join()
+            self.pool = None
 
-    def load_comments(self, input_file: str = INPUT_CSV) -> bool:
-        """Load comments from CSV file"""
+
+class OnnxScorer:
+    """int8-quantized DistilBERT-SST2 run through ONNX Runtime on CPU
+
+    SST-2 is a binary task, so pos and neg are the softmax probabilities,
+    neu is always 0 and compound is pos - neg, on the same [-1, 1] scale
+    as VADER's compound score.
+    """
+
+    name = 'onnx'
+
+    def __init__(self, model_path: str = ONNX_MODEL_PATH,
+                 tokenizer_name: str = ONNX_TOKENIZER):
+        try:
+            import onnxruntime
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "The onnx model requires onnxruntime and transformers: "
+                "pip install onnxruntime transformers"
+            ) from e
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = os.cpu_count() or 1
+        self.session = onnxruntime.InferenceSession(
+            model_path, options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_name, use_fast=True)
+
+    def score(self, texts: List[str]) -> np.ndarray:
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=ONNX_MAX_LENGTH,
+            return_tensors='np'
+        )
+        logits = []
+        for start in range(0, len(texts), ONNX_BATCH_SIZE):
+            feed = {
+                name: encoded[name][start:start + ONNX_BATCH_SIZE].astype(np.int64)
+                for name in self.input_names
+            }
+            logits.append(self.session.run(None, feed)[0])
+        logits = np.concatenate(logits)
+
+        # Softmax over (NEGATIVE, POSITIVE)
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probs = exp / exp.sum(axis=1, keepdims=True)
+        neg, pos = probs[:, 0], probs[:, 1]
+        return np.column_stack([neg, np.zeros_like(neg), pos, pos - neg])
+
+    def close(self, abort: bool = False) -> None:
+        pass
+
+
+SCORERS = {'vader': VaderScorer, 'onnx': OnnxScorer}
+
+
+class SentimentAnalyzer:
+    def __init__(self, scorer: Optional[Scorer] = None):
+        self.scorer = scorer or VaderScorer()
+        # Rows written since the output was last fsynced
+        self.unsynced_rows = 0
+        self.reset_totals()
+
+    def reset_totals(self) -> None:
+        """Zero the running totals, so the summary never needs the full result set"""
+        self.total_comments = 0
+        self.compound_sum = 0.0
+        # Per-sentiment (count, likes, replies), rows indexed like SENTIMENT_LABELS
+        self.sentiment_totals = np.zeros((len(SENTIMENT_LABELS), 3), dtype=np.int64)
+
+    def update_totals(self, label_idx: np.ndarray, compound: np.ndarray,
+                      likes: np.ndarray, replies: np.ndarray) -> None:
+        """Fold a batch of scored comments into the running totals"""
+        # One scatter-add folds counts, likes and replies into their sentiment rows
+        np.add.at(self.sentiment_totals, label_idx, np.column_stack([
+            np.ones(len(label_idx), dtype=np.int64), likes, replies
+        ]))
+        self.total_comments += len(label_idx)
+        self.compound_sum += float(compound.sum())
+
+    def restore_totals(self, output_file: str) -> Optional[Tuple[int, Tuple[str, str]]]:
+        """Fold rows an interrupted run left in its partial output into the totals
+
+        Returns the number of rows found and the (author_name, comment_text)
+        of the last one, or None if there is nothing usable to resume from.
+        """
+        if not os.path.exists(output_file) or os.path.getsize(output_file) == 0:
+            return None
+        try:
+            reader = pyarrow.csv.open_csv(
+                output_file,
+                parse_options=pyarrow.csv.ParseOptions(newlines_in_values=True),
+                convert_options=pyarrow.csv.ConvertOptions(
+                    column_types=OUTPUT_SCHEMA,
+                    include_columns=['author_name', 'sentiment', 'compound_score',
+                                     'likes', 'reply_count', 'comment_text']
+                )
+            )
+            last_row = None
+            for batch in reader:
+                if not batch.num_rows:
+                    continue
+                label_idx = pyarrow.compute.index_in(
+                    batch.column('sentiment'), value_set=pa.array(SENTIMENT_LABELS)
+                ).to_numpy()
+                self.update_totals(
+                    label_idx,
+                    batch.column('compound_score').to_numpy(),
+                    batch.column('likes').to_numpy(),
+                    batch.column('reply_count').to_numpy()
+                )
+                last_row = (batch.column('author_name')[-1].as_py(),
+                            batch.column('comment_text')[-1].as_py())
+        except Exception as e:
+            logger.warning(f"Cannot resume from {output_file}: {e}")
+            self.reset_totals()
+            return None
+
+        if last_row is None:
+            return None
+        return self.total_comments, last_row
+
+    @staticmethod
+    def skip_scored(batches: Iterator[pa.RecordBatch], scored: int,
+                    last_row: Tuple[str, str]) -> Optional[Iterator[pa.RecordBatch]]:
+        """Skip input rows a previous run already scored
+
+        Returns the remaining batches, or None if the input's row at that
+        position is not the output's last row, i.e. the input has changed.
+        """
+        skipped = 0
+        for batch in batches:
+            if skipped + batch.num_rows < scored:
+                skipped += batch.num_rows
+                continue
+            i = scored - skipped - 1
+            row = (batch.column('author_name')[i].as_py(),
+                   batch.column('comment_text')[i].as_py())
+            if row != last_row:
+                return None
+            rest = batch.slice(i + 1)
+            return chain([rest], batches) if rest.num_rows else batches
+        return None
+
+    def load_comments(self, input_file: str = INPUT_PARQUET) -> Optional[Iterator[pa.RecordBatch]]:
+        """Open the scraped comments as a stream of Arrow record batches
+
+        Parquet is the scraper's output. CSV input from older runs is still
+        accepted, parsed by Arrow's multi-threaded CSV reader. Either file is
+        memory-mapped, so it is read straight from the page cache.
+        """
         logger.info(f"Loading comments from {input_file}")
         try:
-            with open(input_file, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                self.comments = list(reader)
-            logger.info(f"Loaded {len(self.comments)} comments")
-            return True
+            source = pa.memory_map(input_file, 'r')
+            if input_file.endswith('.csv'):
+                return pyarrow.csv.open_csv(
+                    source,
+                    read_options=pyarrow.csv.ReadOptions(
+                        use_threads=True, block_size=READ_BLOCK_SIZE
+                    ),
+                    parse_options=pyarrow.csv.ParseOptions(newlines_in_values=True),
+                    convert_options=pyarrow.csv.ConvertOptions(
+                        column_types=INPUT_TYPES, include_columns=list(INPUT_TYPES)
+                    )
+                )
+            return pyarrow.parquet.ParquetFile(source).iter_batches(
+                batch_size=READ_BATCH_ROWS, columns=list(INPUT_TYPES)
+            )
         except FileNotFoundError:
             logger.error(f"{input_file} not found")
-            return False
+            return None
         except Exception as e:
             logger.error(f"Error loading comments: {e}")
-            return False
-
-    def classify_sentiment(self, compound_score: float) -> str:
-        """Classify sentiment based on compound score"""
-        if compound_score > POSITIVE_THRESHOLD:
-            return 'Positive'
-        elif compound_score < NEGATIVE_THRESHOLD:
-            return 'Negative'
-        else:
-            return 'Neutral'
-
-    def analyze_comments(self) -> None:
-        """Analyze sentiment for each comment"""
-        logger.info("Analyzing sentiment for comments...")
-        for i, comment in enumerate(self.comments, 1):
-            if i % 500 == 0:
-                logger.info(f"Processed {i}/{len(self.comments)} comments")
-
-            comment_text = comment.get('comment_text', '')
-            scores = self.sia.polarity_scores(comment_text)
-
-            analyzed = {
-                'author_name': comment.get('author_name', ''),
-                'comment_text': comment_text,
-                'likes': comment.get('likes', 0),
-                'reply_count': comment.get('reply_count', 0),
-                'positive_score': round(scores['pos'], 4),
-                'negative_score': round(scores['neg'], 4),
-                'neutral_score': round(scores['neu'], 4),
-                'compound_score': round(scores['compound'], 4),
-                'sentiment': self.classify_sentiment(scores['compound'])
-            }
-            self.analyzed_comments.append(analyzed)
+            return None
 
-        logger.info(f"Completed sentiment analysis for {len(self.analyzed_comments)} comments")
+    def analyze_comments(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """Score a batch of comments and fold it into the running totals"""
+        scores = self.scorer.score(batch.column('comment_text').to_pylist())
+        np.round(scores, 4, out=scores)
+        compound = scores[:, 3]
+        label_idx = np.searchsorted(SENTIMENT_BINS, compound, side='right')
+        labels = SENTIMENT_LABELS[label_idx]
 
-    def export_to_csv(self, output_file: str = OUTPUT_CSV) -> None:
-        """Export analyzed comments to CSV"""
-        if not self.analyzed_comments:
-            logger.warning("No analyzed comments to export")
-            return
+        self.update_totals(
+            label_idx,
+            compound,
+            batch.column('likes').to_numpy(),
+            batch.column('reply_count').to_numpy()
+        )
 
-        logger.info(f"Exporting {len(self.analyzed_comments)} analyzed comments to {output_file}")
-        try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'author_name',
-                    'sentiment',
-                    'compound_score',
-                    'positive_score',
-                    'negative_score',
-                    'neutral_score',
-                    'likes',
-                    'reply_count',
-                    'comment_text'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self.analyzed_comments)
-
-            logger.info(f"CSV export successful: {output_file}")
-        except Exception as e:
-            logger.error(f"Error writing CSV file: {e}")
-            raise
+        return pa.RecordBatch.from_arrays([
+            batch.column('author_name'),
+            pa.array(labels),
+            pa.array(compound),
+            pa.array(scores[:, 2]),
+            pa.array(scores[:, 0]),
+            pa.array(scores[:, 1]),
+            batch.column('likes'),
+            batch.column('reply_count'),
+            batch.column('comment_text')
+        ], schema=OUTPUT_SCHEMA)
+
+    def export_to_csv(self, analyzed: pa.RecordBatch, writer: pyarrow.csv.CSVWriter,
+                      sink: BinaryIO) -> None:
+        """Append a batch of analyzed comments to the output CSV"""
+        writer.write_batch(analyzed)
+        self.unsynced_rows += analyzed.num_rows
+        if self.unsynced_rows >= FLUSH_EVERY_ROWS:
+            sink.flush()
+            os.fsync(sink.fileno())
+            self.unsynced_rows = 0
 
     def print_summary(self) -> None:
         """Print summary statistics"""
-        if not self.analyzed_comments:
+        if not self.total_comments:
             logger.info("No comments to summarize")
             return
 
-        # Calculate sentiment distribution
-        sentiment_counts = {'Positive': 0, 'Negative': 0, 'Neutral': 0}
-        sentiment_likes = {'Positive': 0, 'Negative': 0, 'Neutral': 0}
-        sentiment_replies = {'Positive': 0, 'Negative': 0, 'Neutral': 0}
-
-        for comment in self.analyzed_comments:
-            sentiment = comment['sentiment']
-            sentiment_counts[sentiment] += 1
-            sentiment_likes[sentiment] += int(comment['likes'])
-            sentiment_replies[sentiment] += int(comment['reply_count'])
-
-        total_comments = len(self.analyzed_comments)
-        total_likes = sum(int(c['likes']) for c in self.analyzed_comments)
-        total_replies = sum(int(c['reply_count']) for c in self.analyzed_comments)
-        avg_compound = sum(c['compound_score'] for c in self.analyzed_comments) / total_comments
+        total_comments = self.total_comments
+        _, total_likes, total_replies = self.sentiment_totals.sum(axis=0).tolist()
+        avg_compound = self.compound_sum / total_comments
 
         logger.info("\n" + "="*70)
         logger.info("SENTIMENT ANALYSIS SUMMARY")
@@ -149,34 +508,95 @@ class SentimentAnalyzer:
         logger.info("-" * 70)
 
         for sentiment in ['Positive', 'Negative', 'Neutral']:
-            count = sentiment_counts[sentiment]
+            count, likes, replies = self.sentiment_totals[SENTIMENT_INDEX[sentiment]].tolist()
             percentage = (count / total_comments * 100) if total_comments > 0 else 0
-            avg_likes = (sentiment_likes[sentiment] / count if count > 0 else 0)
-            avg_replies = (sentiment_replies[sentiment] / count if count > 0 else 0)
+            avg_likes = (likes / count if count > 0 else 0)
+            avg_replies = (replies / count if count > 0 else 0)
 
             logger.info(f"{sentiment:12} | Count: {count:5} ({percentage:5.2f}%) | "
                        f"Avg Likes: {avg_likes:6.2f} | Avg Replies: {avg_replies:6.2f}")
 
         logger.info("="*70 + "\n")
 
-    def run(self) -> None:
-        """Execute the full workflow"""
+    def run(self, input_file: str = INPUT_PARQUET, output_file: str = OUTPUT_CSV) -> None:
+        """Execute the full workflow, scoring and appending one batch at a time
+
+        Output is appended and synced to a partial file named after the
+        scorer as it is produced, and only replaces output_file once every
+        batch is in. A leftover partial file from the same scorer means a
+        run was interrupted, so scoring resumes after the rows it already
+        wrote.
+        """
         logger.info("Starting Sentiment Analysis...")
 
-        if not self.load_comments():
+        partial_file = f"{output_file}.{self.scorer.name}{PARTIAL_SUFFIX}"
+        resume = self.restore_totals(partial_file)
+        batches = self.load_comments(input_file)
+        if batches is None:
             return
 
-        self.analyze_comments()
-        self.export_to_csv()
+        appending = False
+        if resume:
+            scored, last_row = resume
+            remaining = self.skip_scored(batches, scored, last_row)
+            if remaining is None:
+                logger.warning(f"{partial_file} does not match {input_file}; starting over")
+                self.reset_totals()
+                batches = self.load_comments(input_file)
+                if batches is None:
+                    return
+            else:
+                logger.info(f"Resuming after {scored} comments already in {partial_file}")
+                batches = remaining
+                appending = True
+
+        logger.info(f"Analyzing sentiment and streaming results to {output_file}")
+        self.unsynced_rows = 0
+        try:
+            with open(partial_file, 'ab' if appending else 'wb') as sink:
+                write_options = pyarrow.csv.WriteOptions(
+                    include_header=os.fstat(sink.fileno()).st_size == 0
+                )
+                with pyarrow.csv.CSVWriter(sink, OUTPUT_SCHEMA, write_options=write_options) as writer:
+                    for batch in batches:
+                        self.export_to_csv(self.analyze_comments(batch), writer, sink)
+                        logger.info(f"Processed {self.total_comments} comments")
+                sink.flush()
+                os.fsync(sink.fileno())
+            os.replace(partial_file, output_file)
+        except Exception as e:
+            logger.error(f"Error writing CSV file: {e}")
+            self.scorer.close(abort=True)
+            raise
+        except KeyboardInterrupt:
+            self.scorer.close(abort=True)
+            raise
+        self.scorer.close()
+
+        logger.info(f"Completed sentiment analysis for {self.total_comments} comments")
         self.print_summary()
 
         logger.info("Workflow completed successfully")
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--input',
+        default=INPUT_PARQUET if os.path.exists(INPUT_PARQUET) else INPUT_CSV,
+        help='scraped comments, .parquet or .csv (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--model',
+        choices=sorted(SCORERS),
+        default='vader',
+        help='sentiment scorer to use (default: vader)'
+    )
+    args = parser.parse_args()
+
     try:
-        analyzer = SentimentAnalyzer()
-        analyzer.run()
+        analyzer = SentimentAnalyzer(scorer=SCORERS[args.model]())
+        analyzer.run(input_file=args.input)
     except KeyboardInterrupt:
         logger.info("Script interrupted by user")
     except Exception as e: